@@ -4,7 +4,8 @@ Automated deployment script for FullTokenContract on Starknet/Katana.
 
 This script handles:
 - Proper ByteArray serialization for string parameters
-- Direct UDC invocation via sncast (compatible with Katana v0.9.0-rc.2)
+- Direct UDC invocation over JSON-RPC via starknet-py, or via sncast with --use-sncast
+  (compatible with Katana v0.9.0-rc.2)
 - Automatic extraction of deployed contract address
 - Error handling and validation
 
@@ -12,17 +13,60 @@ Usage:
     python3 scripts/deploy_token.py [options]
 
 Requirements:
-    - sncast v0.50.0 or later
+    - starknet-py (pip install starknet-py) and Python 3.11+, or
+      sncast v0.50.0 or later when using --use-sncast
     - snfoundry.toml configured with account details
 """
 
+import asyncio
+import functools
 import json
+import os
+import shutil
 import subprocess
 import sys
+import threading
 import argparse
+from pathlib import Path
 from typing import List, Tuple, Optional
 from dataclasses import dataclass
 
+try:
+    import tomllib
+except ModuleNotFoundError:  # Python < 3.11
+    tomllib = None
+
+try:
+    from starknet_py.hash.selector import get_selector_from_name
+    from starknet_py.net.account.account import Account
+    from starknet_py.net.client_errors import ClientError
+    from starknet_py.net.client_models import Call
+    from starknet_py.net.full_node_client import FullNodeClient
+    from starknet_py.net.signer.stark_curve_signer import KeyPair
+    from starknet_py.transaction_errors import TransactionFailedError
+    HAS_STARKNET_PY = True
+except ImportError:  # Only required for direct RPC mode; --use-sncast works without it
+    HAS_STARKNET_PY = False
+
+
+# sncast resolves snfoundry.toml profiles relative to the token package
+_SNCAST_CWD = '/workspace/game-components/packages/token'
+SNFOUNDRY_TOML = os.path.join(_SNCAST_CWD, 'snfoundry.toml')
+STARKNET_RPC_URL = 'https://api.cartridge.gg/x/provable-dw/katana'
+
+
+def _find_starkli() -> Optional[str]:
+    """Locate the starkli binary, preferring the default starkliup install."""
+    default_path = '/home/ubuntu/.starkli/bin/starkli'
+    if os.path.isfile(default_path):
+        return default_path
+    return shutil.which('starkli')
+
+
+# Resolved once per process instead of probing on every receipt lookup
+_STARKLI_BIN = _find_starkli()
+_STARKLI_ENV = {**os.environ, 'STARKNET_RPC': STARKNET_RPC_URL}
+
 
 @dataclass
 class DeploymentConfig:
@@ -39,6 +83,7 @@ class DeploymentConfig:
     profile: str
     salt: int = 0
     unique: bool = True
+    use_sncast: bool = False
 
 
 def encode_bytearray(s: str) -> List[str]:
@@ -56,29 +101,96 @@ def encode_bytearray(s: str) -> List[str]:
     Returns:
         List of hex strings representing the ByteArray
     """
-    s_bytes = s.encode('utf-8')
-    num_full_words = len(s_bytes) // 31
-    pending_len = len(s_bytes) % 31
+    return encode_bytearrays_batch([s])[0]
 
-    result = [str(num_full_words)]
 
-    # Add full words (31 bytes each)
-    for i in range(num_full_words):
-        word_bytes = s_bytes[i*31:(i+1)*31]
-        word_hex = '0x' + word_bytes.hex()
-        result.append(word_hex)
+def encode_bytearrays_batch(strings: List[str]) -> List[List[str]]:
+    """
+    Encode several strings into Cairo ByteArray format with a single hex conversion.
 
-    # Add pending word and length
-    if pending_len > 0:
-        pending_bytes = s_bytes[num_full_words*31:]
-        pending_hex = '0x' + pending_bytes.hex()
-        result.append(pending_hex)
-        result.append(str(pending_len))
-    else:
-        result.append('0')
-        result.append('0')
+    All strings are hex-encoded together in one pass and each ByteArray is sliced
+    back out of the shared hex buffer by its byte offset.
+
+    Args:
+        strings: Strings to encode
+
+    Returns:
+        One list of hex strings per input string, as returned by encode_bytearray
+    """
+    encoded = [s.encode('utf-8') for s in strings]
+    all_hex = b''.join(encoded).hex()
+
+    results = []
+    start = 0
+    for s_bytes in encoded:
+        end = start + len(s_bytes) * 2
+
+        # Fast path: strings shorter than one word (names, symbols) are only a pending word
+        if len(s_bytes) < 31:
+            results.append(['0', '0x' + all_hex[start:end] if s_bytes else '0', str(len(s_bytes))])
+            start = end
+            continue
+
+        num_full_words = len(s_bytes) // 31
+        full_end = start + num_full_words * 62
+        pending_len = len(s_bytes) - num_full_words * 31
+
+        result = [str(num_full_words)]
+
+        # Add full words (31 bytes = 62 hex chars each)
+        result.extend('0x' + all_hex[i:i + 62] for i in range(start, full_end, 62))
+
+        # Add pending word and length
+        if pending_len > 0:
+            result.append('0x' + all_hex[full_end:end])
+            result.append(str(pending_len))
+        else:
+            result.append('0')
+            result.append('0')
+
+        results.append(result)
+        start = end
+
+    return results
+
+
+def decode_bytearray(felts: List[int]) -> str:
+    """
+    Decode a serialized Cairo ByteArray back into a string.
+
+    Inverse of encode_bytearray, operating on the felts returned by a contract call.
+
+    Args:
+        felts: Serialized ByteArray felts
+
+    Returns:
+        Decoded string
+    """
+    num_full_words = felts[0]
+    data = b''.join(word.to_bytes(31, 'big') for word in felts[1:1 + num_full_words])
+
+    pending_word = felts[1 + num_full_words]
+    pending_len = felts[2 + num_full_words]
+    data += pending_word.to_bytes(pending_len, 'big')
+
+    return data.decode('utf-8')
 
-    return result
+
+# Option::None serializes to its variant index alone
+_OPTION_NONE = ('1',)
+
+
+def _encode_option(value: Optional[str]) -> Tuple[str, ...]:
+    """
+    Encode an Option<ContractAddress> as calldata.
+
+    Args:
+        value: Address, or None/empty for Option::None
+
+    Returns:
+        ('0', value) for Option::Some, ('1',) for Option::None
+    """
+    return ('0', value) if value else _OPTION_NONE
 
 
 def build_constructor_calldata(config: DeploymentConfig) -> Tuple[int, List[str]]:
@@ -91,40 +203,63 @@ def build_constructor_calldata(config: DeploymentConfig) -> Tuple[int, List[str]
     Returns:
         Tuple of (calldata_length, calldata_list)
     """
-    calldata = []
+    name_encoded, symbol_encoded, base_uri_encoded = encode_bytearrays_batch(
+        [config.name, config.symbol, config.base_uri]
+    )
 
-    # Serialize ByteArray parameters
-    name_encoded = encode_bytearray(config.name)
-    symbol_encoded = encode_bytearray(config.symbol)
-    base_uri_encoded = encode_bytearray(config.base_uri)
+    calldata = [
+        *name_encoded,
+        *symbol_encoded,
+        *base_uri_encoded,
+        config.royalty_receiver,
+        str(config.royalty_fraction),
+        *_encode_option(config.game_registry_address),
+        *_encode_option(config.event_relayer_address),
+    ]
 
-    # Build calldata
-    calldata.extend(name_encoded)
-    calldata.extend(symbol_encoded)
-    calldata.extend(base_uri_encoded)
-    calldata.append(config.royalty_receiver)
-    calldata.append(str(config.royalty_fraction))
+    return len(calldata), calldata
 
-    # game_registry_address: Option<ContractAddress>
-    if config.game_registry_address:
-        calldata.append('0')  # Option::Some variant
-        calldata.append(config.game_registry_address)
-    else:
-        calldata.append('1')  # Option::None variant
 
-    # event_relayer_address: Option<ContractAddress>
-    if config.event_relayer_address:
-        calldata.append('0')  # Option::Some variant
-        calldata.append(config.event_relayer_address)
-    else:
-        calldata.append('1')  # Option::None variant
+def _read_profile(profile: str) -> Tuple[str, dict]:
+    """
+    Read the RPC URL and account for an sncast profile from snfoundry.toml.
+
+    Args:
+        profile: sncast profile name
+
+    Returns:
+        Tuple of (rpc_url, account_entry)
+    """
+    if tomllib is None:
+        raise ValueError("Reading snfoundry.toml requires Python 3.11+ (or pass --use-sncast)")
+
+    with open(SNFOUNDRY_TOML, 'rb') as f:
+        snfoundry = tomllib.load(f)
+
+    profile_config = snfoundry.get('sncast', {}).get(profile)
+    if profile_config is None:
+        raise ValueError(f"Profile '{profile}' not found in {SNFOUNDRY_TOML}")
+
+    accounts = snfoundry.get('tool', {}).get('sncast', {}).get('account', [])
+    for account in accounts:
+        if account.get('name') == profile_config.get('account'):
+            return profile_config['url'], account
+
+    raise ValueError(f"Account '{profile_config.get('account')}' not found in {SNFOUNDRY_TOML}")
 
-    return len(calldata), calldata
 
+@functools.lru_cache(maxsize=None)
+def _rpc_client(rpc_url: str) -> 'FullNodeClient':
+    """Return a shared RPC client per node URL for deploy, receipt and verify calls."""
+    return FullNodeClient(node_url=rpc_url)
 
-def deploy_via_udc(config: DeploymentConfig) -> Tuple[bool, str, str]:
+
+async def deploy_via_udc(config: DeploymentConfig) -> Tuple[bool, str, str]:
     """
-    Deploy contract via Universal Deployer Contract using sncast.
+    Deploy contract via Universal Deployer Contract.
+
+    The invoke is signed and submitted directly over JSON-RPC, or through sncast
+    when config.use_sncast is set.
 
     Args:
         config: Deployment configuration
@@ -145,60 +280,241 @@ def deploy_via_udc(config: DeploymentConfig) -> Tuple[bool, str, str]:
     ]
     udc_calldata.extend(constructor_calldata)
 
+    print(f"Deploying contract...")
+    print(f"  Class Hash: {config.class_hash}")
+    print(f"  Constructor Args: {calldata_len} parameters")
+    print(f"  UDC Address: {config.udc_address}")
+    print(f"  Salt: {config.salt}")
+    print(f"  Unique: {config.unique}")
+    print()
+
+    if config.use_sncast:
+        return _invoke_udc_sncast(config, udc_calldata)
+    return await _invoke_udc_rpc(config, udc_calldata)
+
+
+async def _invoke_udc_rpc(config: DeploymentConfig, udc_calldata: List[str]) -> Tuple[bool, str, str]:
+    """
+    Sign and submit the UDC deployContract invoke directly over JSON-RPC.
+
+    Args:
+        config: Deployment configuration
+        udc_calldata: Serialized deployContract calldata
+
+    Returns:
+        Tuple of (success, transaction_hash, error_message)
+    """
+    if not HAS_STARKNET_PY:
+        return False, "", "starknet-py is not installed (pip install starknet-py), or pass --use-sncast"
+
+    try:
+        rpc_url, account_entry = _read_profile(config.profile)
+        client = _rpc_client(rpc_url)
+        account = Account(
+            client=client,
+            address=account_entry['address'],
+            key_pair=KeyPair.from_private_key(account_entry['private_key']),
+            chain=int(await client.get_chain_id(), 16)
+        )
+
+        call = Call(
+            to_addr=int(config.udc_address, 16),
+            selector=get_selector_from_name('deployContract'),
+            calldata=[int(felt, 0) for felt in udc_calldata]
+        )
+        response = await account.execute_v3(calls=call, auto_estimate=True)
+
+    except (ClientError, OSError, ValueError) as e:
+        return False, "", str(e)
+
+    tx_hash = f"{response.transaction_hash:#066x}"
+    print(f"Transaction Hash: {tx_hash}")
+    return True, tx_hash, ""
+
+
+def _parse_sncast_json(output: str) -> dict:
+    """
+    Parse the result object from `sncast --json` output.
+
+    sncast may print further JSON lines (e.g. explorer links) after the result,
+    so only the first object is decoded.
+
+    Args:
+        output: sncast stdout, or a single line of it
+
+    Returns:
+        Decoded result object
+    """
+    data, _ = json.JSONDecoder().raw_decode(output.lstrip())
+    return data
+
+
+def _run_sncast(cmd: List[str], result_key: str) -> Tuple[Optional[dict], int, str]:
+    """
+    Run sncast, picking its JSON result out of stdout as the lines arrive.
+
+    stdout is streamed line by line (and echoed) instead of being buffered until
+    the process exits, so the result is parsed as soon as the line carrying
+    `result_key` is printed. The call still returns only once sncast has exited.
+    stderr is drained on a background thread so neither pipe can fill up.
+
+    Args:
+        cmd: sncast command line (with --json)
+        result_key: Key identifying the result object, e.g. 'transaction_hash'
+
+    Returns:
+        Tuple of (result or None, return_code, stderr)
+    """
+    proc = subprocess.Popen(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+        bufsize=1,
+        cwd=_SNCAST_CWD
+    )
+
+    stderr_chunks = []
+    stderr_reader = threading.Thread(target=lambda: stderr_chunks.append(proc.stderr.read()), daemon=True)
+    stderr_reader.start()
+
+    # Only JSON lines mentioning the result key are worth decoding
+    key_token = f'"{result_key}"'
+
+    result = None
+    for line in proc.stdout:
+        print(line, end='')
+        if result is not None or not line.lstrip().startswith('{'):
+            continue
+        if key_token not in line:
+            continue
+        try:
+            data = _parse_sncast_json(line)
+        except json.JSONDecodeError:
+            continue
+        if isinstance(data, dict) and result_key in data:
+            result = data
+
+    try:
+        proc.wait(timeout=30)
+    except subprocess.TimeoutExpired:
+        proc.kill()
+        proc.wait()
+    stderr_reader.join()
+
+    return result, proc.returncode, ''.join(stderr_chunks)
+
+
+def _invoke_udc_sncast(config: DeploymentConfig, udc_calldata: List[str]) -> Tuple[bool, str, str]:
+    """
+    Submit the UDC deployContract invoke using sncast.
+
+    Args:
+        config: Deployment configuration
+        udc_calldata: Serialized deployContract calldata
+
+    Returns:
+        Tuple of (success, transaction_hash, error_message)
+    """
     # Build sncast command
     cmd = [
         'sncast',
         '--profile', config.profile,
+        '--json',
         'invoke',
         '--contract-address', config.udc_address,
         '--function', 'deployContract',
         '--calldata',
+        *udc_calldata,
     ]
-    cmd.extend(udc_calldata)
 
-    print(f"Deploying contract...")
-    print(f"  Class Hash: {config.class_hash}")
-    print(f"  Constructor Args: {calldata_len} parameters")
-    print(f"  UDC Address: {config.udc_address}")
-    print(f"  Salt: {config.salt}")
-    print(f"  Unique: {config.unique}")
-    print()
+    result, returncode, stderr = _run_sncast(cmd, 'transaction_hash')
+    if result is not None:
+        return True, result['transaction_hash'], ""
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd='/workspace/game-components/packages/token'
-        )
+    if returncode != 0:
+        return False, "", stderr or f"sncast exited with status {returncode}"
 
-        # Parse output to extract transaction hash
-        output = result.stdout
-        print(output)
+    # If transaction hash is not found, print stderr for debugging
+    print(f"\n--- Full sncast stderr ---")
+    print(stderr)
+    print(f"--- End sncast stderr ---")
 
-        # Extract transaction hash from output
-        for line in output.split('\n'):
-            if 'Transaction Hash:' in line:
-                tx_hash = line.split('Transaction Hash:')[1].strip()
-                return True, tx_hash, ""
+    return False, "", "Could not find transaction hash in output"
 
-        # If transaction hash is not found, print full output for debugging
-        print(f"\n--- Full sncast stdout ---")
-        print(output)
-        print(f"--- End sncast stdout ---")
-        print(f"\n--- Full sncast stderr ---")
-        print(result.stderr)
-        print(f"--- End sncast stderr ---")
 
-        return False, "", "Could not find transaction hash in output"
+@functools.lru_cache(maxsize=128)
+def _fetch_receipt(tx_hash: str) -> dict:
+    """
+    Fetch a transaction receipt with starkli.
+
+    Successful lookups are cached per tx hash; failures raise and are not cached,
+    so a retry will query the node again.
+
+    Args:
+        tx_hash: Transaction hash
+
+    Returns:
+        Parsed receipt JSON
+    """
+    if _STARKLI_BIN is None:
+        raise FileNotFoundError('starkli')
+
+    result = subprocess.run(
+        [_STARKLI_BIN, 'transaction-receipt', tx_hash],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=_STARKLI_ENV
+    )
+    return json.loads(result.stdout)
+
+
+async def _wait_receipt(client: 'FullNodeClient', tx_hash: str, retry_interval: float = 0.4):
+    """
+    Poll starknet_getTransactionReceipt until the transaction has executed.
+
+    Args:
+        client: RPC client
+        tx_hash: Transaction hash
+        retry_interval: Seconds between polls
+
+    Returns:
+        Transaction receipt once execution succeeded and the tx is accepted on L2
+    """
+    return await client.wait_for_tx(int(tx_hash, 16), check_interval=retry_interval)
 
-    except subprocess.CalledProcessError as e:
-        error_msg = e.stderr if e.stderr else str(e)
-        return False, "", error_msg
 
+async def _contract_address_from_rpc(tx_hash: str, profile: str) -> Optional[str]:
+    """
+    Wait for the deployment receipt over JSON-RPC and read the deployed address.
 
-def get_contract_address_from_tx(tx_hash: str, profile: str) -> Optional[str]:
+    Args:
+        tx_hash: Transaction hash
+        profile: sncast profile name
+
+    Returns:
+        Contract address or None if not found
+    """
+    if not HAS_STARKNET_PY:
+        return None
+
+    try:
+        rpc_url, _ = _read_profile(profile)
+        receipt = await _wait_receipt(_rpc_client(rpc_url), tx_hash)
+    except (ClientError, TransactionFailedError, OSError, ValueError) as e:
+        print(f"⚠️  Could not fetch transaction receipt: {e}")
+        return None
+
+    # First data field of the UDC ContractDeployed event is the deployed contract address
+    if receipt.events and receipt.events[0].data:
+        return f"{receipt.events[0].data[0]:#066x}"
+
+    return None
+
+
+async def get_contract_address_from_tx(tx_hash: str, profile: str,
+                                       use_sncast: bool = False) -> Optional[str]:
     """
     Extract deployed contract address from transaction receipt.
 
@@ -207,66 +523,43 @@ def get_contract_address_from_tx(tx_hash: str, profile: str) -> Optional[str]:
     Args:
         tx_hash: Transaction hash
         profile: sncast profile name
+        use_sncast: Read the receipt with starkli instead of polling over JSON-RPC
 
     Returns:
         Contract address or None if not found
     """
     print(f"\nFetching transaction receipt...")
 
-    # Try starkli first (with full path)
-    starkli_paths = [
-        '/home/ubuntu/.starkli/bin/starkli',
-        'starkli'
-    ]
-
-    for starkli_path in starkli_paths:
-        cmd = [
-            starkli_path,
-            'transaction-receipt',
-            tx_hash
-        ]
+    if not use_sncast:
+        contract_address = await _contract_address_from_rpc(tx_hash, profile)
+        if contract_address is not None:
+            return contract_address
 
+    else:
         try:
-            import os
-            env = os.environ.copy()
-            env['STARKNET_RPC'] = 'https://api.cartridge.gg/x/provable-dw/katana'
-
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                check=True,
-                env=env
-            )
-
-            receipt = json.loads(result.stdout)
-
-            # Find ContractDeployed event from UDC
-            if 'events' in receipt and len(receipt['events']) > 0:
-                # The first event should be from the UDC
-                udc_event = receipt['events'][0]
-                if 'data' in udc_event and len(udc_event['data']) > 0:
-                    # First data field is the deployed contract address
-                    contract_address = udc_event['data'][0]
-                    return contract_address
-
-            return None
-
-        except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError) as e:
-            # Try next starkli path
-            continue
-
-    # If starkli doesn't work, provide manual instructions
+            receipt = _fetch_receipt(tx_hash)
+        except (subprocess.CalledProcessError, FileNotFoundError, json.JSONDecodeError):
+            receipt = None
+
+        if receipt is not None:
+            # First data field of the UDC ContractDeployed event is the deployed contract address
+            try:
+                return receipt['events'][0]['data'][0]
+            except (KeyError, IndexError):
+                return None
+
+    # If the receipt lookup doesn't work, provide manual instructions
     print(f"⚠️  Could not automatically extract contract address")
     print(f"\nTo get the contract address, run:")
-    print(f"  export STARKNET_RPC=https://api.cartridge.gg/x/provable-dw/katana")
+    print(f"  export STARKNET_RPC={STARKNET_RPC_URL}")
     print(f"  starkli transaction-receipt {tx_hash}")
     print(f"\nThe contract address is in events[0].data[0]")
 
     return None
 
 
-def verify_deployment(contract_address: str, profile: str, expected_name: str) -> bool:
+async def verify_deployment(contract_address: str, profile: str, expected_name: str,
+                            use_sncast: bool = False) -> bool:
     """
     Verify contract deployment by calling the name() function.
 
@@ -274,6 +567,7 @@ def verify_deployment(contract_address: str, profile: str, expected_name: str) -
         contract_address: Deployed contract address
         profile: sncast profile name
         expected_name: Expected token name
+        use_sncast: Call through sncast instead of starknet_call over JSON-RPC
 
     Returns:
         True if verification successful
@@ -282,37 +576,142 @@ def verify_deployment(contract_address: str, profile: str, expected_name: str) -
     print(f"  Contract Address: {contract_address}")
     print(f"  Expected Name: {expected_name}")
 
+    if use_sncast:
+        # sncast blocks, so run it on a worker thread to keep the event loop free
+        output = await asyncio.get_running_loop().run_in_executor(
+            None, _call_name_sncast, contract_address, profile
+        )
+    else:
+        output = await _call_name_rpc(contract_address, profile)
+
+    if output is None:
+        return False
+
+    # Check if expected name is in output
+    if expected_name in output:
+        print(f"✅ Verification successful!")
+        return True
+    else:
+        print(f"⚠️  Warning: Name mismatch in verification")
+        return False
+
+
+async def _call_name_rpc(contract_address: str, profile: str) -> Optional[str]:
+    """
+    Call name() on the deployed contract with starknet_call.
+
+    Args:
+        contract_address: Deployed contract address
+        profile: sncast profile name
+
+    Returns:
+        Decoded token name, or None if the call failed
+    """
+    if not HAS_STARKNET_PY:
+        print(f"⚠️  Verification failed: starknet-py is not installed")
+        return None
+
+    try:
+        rpc_url, _ = _read_profile(profile)
+        call = Call(
+            to_addr=int(contract_address, 16),
+            selector=get_selector_from_name('name'),
+            calldata=[]
+        )
+        name = decode_bytearray(await _rpc_client(rpc_url).call_contract(call, block_number='latest'))
+
+    except (ClientError, OSError, ValueError, IndexError) as e:
+        print(f"⚠️  Verification failed: {e}")
+        return None
+
+    print(f"  Name: {name}")
+    return name
+
+
+def _call_name_sncast(contract_address: str, profile: str) -> Optional[str]:
+    """
+    Call name() on the deployed contract using sncast.
+
+    Args:
+        contract_address: Deployed contract address
+        profile: sncast profile name
+
+    Returns:
+        Call response from sncast, or None if the call failed
+    """
     cmd = [
         'sncast',
         '--profile', profile,
+        '--json',
         'call',
         '--contract-address', contract_address,
         '--function', 'name'
     ]
 
-    try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd='/workspace/game-components/packages/token'
-        )
+    result, returncode, stderr = _run_sncast(cmd, 'response')
+    if result is not None:
+        return str(result['response'])
 
-        output = result.stdout
-        print(output)
+    if returncode != 0:
+        print(f"⚠️  Verification failed: {stderr}")
+    else:
+        print(f"⚠️  Verification failed: unexpected sncast output")
+    return None
 
-        # Check if expected name is in output
-        if expected_name in output:
-            print(f"✅ Verification successful!")
-            return True
-        else:
-            print(f"⚠️  Warning: Name mismatch in verification")
-            return False
 
-    except subprocess.CalledProcessError as e:
-        print(f"⚠️  Verification failed: {e.stderr}")
-        return False
+def _write_deployment_file(contract_address: str, tx_hash: str, config: DeploymentConfig) -> None:
+    """Write the deployment details to LATEST_DEPLOYMENT.txt for easy access."""
+    Path('/workspace/game-components/LATEST_DEPLOYMENT.txt').write_text(
+        f"Contract Address: {contract_address}\n"
+        f"Transaction Hash: {tx_hash}\n"
+        f"Class Hash: {config.class_hash}\n"
+        f"Name: {config.name}\n"
+        f"Symbol: {config.symbol}\n"
+    )
+
+
+async def main_async(config: DeploymentConfig, verify: bool = True) -> None:
+    """
+    Deploy, wait for the receipt and verify in a single event loop.
+
+    Args:
+        config: Deployment configuration
+        verify: Call name() on the deployed contract once the receipt arrives
+    """
+    # Deploy contract
+    success, tx_hash, error = await deploy_via_udc(config)
+
+    if not success:
+        print(f"\n❌ Deployment failed: {error}")
+        sys.exit(1)
+
+    print(f"\n✅ Deployment transaction submitted!")
+    print(f"   Transaction Hash: {tx_hash}")
+
+    # Get contract address from transaction
+    contract_address = await get_contract_address_from_tx(tx_hash, config.profile, config.use_sncast)
+
+    if contract_address:
+        print(f"\n🎉 Contract deployed successfully!")
+        print(f"   Contract Address: {contract_address}")
+
+        # Verify deployment while the details are written out on a worker thread
+        loop = asyncio.get_running_loop()
+        tasks = []
+        if verify:
+            tasks.append(verify_deployment(contract_address, config.profile, config.name, config.use_sncast))
+        tasks.append(loop.run_in_executor(None, _write_deployment_file, contract_address, tx_hash, config))
+        await asyncio.gather(*tasks)
+
+        print(f"\n📝 Deployment details saved to: LATEST_DEPLOYMENT.txt")
+
+    else:
+        print(f"\n⚠️  Could not automatically extract contract address")
+        print(f"   Query transaction manually: starkli transaction-receipt {tx_hash}")
+
+    print("\n" + "=" * 80)
+    print("Deployment Complete!")
+    print("=" * 80)
 
 
 def main():
@@ -350,6 +749,8 @@ def main():
                         help='Do not make deployment unique to deployer')
     parser.add_argument('--no-verify', action='store_true',
                         help='Skip deployment verification')
+    parser.add_argument('--use-sncast', action='store_true',
+                        help='Deploy and verify through sncast instead of direct JSON-RPC')
 
     args = parser.parse_args()
 
@@ -366,7 +767,8 @@ def main():
         udc_address=args.udc_address,
         profile=args.profile,
         salt=args.salt,
-        unique=not args.no_unique
+        unique=not args.no_unique,
+        use_sncast=args.use_sncast
     )
 
     print("=" * 80)
@@ -382,44 +784,7 @@ def main():
     print(f"  Event Relayer: {config.event_relayer_address or 'None'}")
     print()
 
-    # Deploy contract
-    success, tx_hash, error = deploy_via_udc(config)
-
-    if not success:
-        print(f"\n❌ Deployment failed: {error}")
-        sys.exit(1)
-
-    print(f"\n✅ Deployment transaction submitted!")
-    print(f"   Transaction Hash: {tx_hash}")
-
-    # Get contract address from transaction
-    contract_address = get_contract_address_from_tx(tx_hash, config.profile)
-
-    if contract_address:
-        print(f"\n🎉 Contract deployed successfully!")
-        print(f"   Contract Address: {contract_address}")
-
-        # Verify deployment
-        if not args.no_verify:
-            verify_deployment(contract_address, config.profile, config.name)
-
-        # Write address to file for easy access
-        with open('/workspace/game-components/LATEST_DEPLOYMENT.txt', 'w') as f:
-            f.write(f"Contract Address: {contract_address}\n")
-            f.write(f"Transaction Hash: {tx_hash}\n")
-            f.write(f"Class Hash: {config.class_hash}\n")
-            f.write(f"Name: {config.name}\n")
-            f.write(f"Symbol: {config.symbol}\n")
-
-        print(f"\n📝 Deployment details saved to: LATEST_DEPLOYMENT.txt")
-
-    else:
-        print(f"\n⚠️  Could not automatically extract contract address")
-        print(f"   Query transaction manually: starkli transaction-receipt {tx_hash}")
-
-    print("\n" + "=" * 80)
-    print("Deployment Complete!")
-    print("=" * 80)
+    asyncio.run(main_async(config, verify=not args.no_verify))
 
 
 if __name__ == '__main__':